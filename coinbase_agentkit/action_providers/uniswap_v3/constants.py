@@ -1,10 +1,16 @@
 """Constants for Uniswap V3 action provider – Ethereum Mainnet"""
 
+from types import MappingProxyType
+from typing import Final
+
 from web3 import Web3
 
 # === 1. Supported network key must match wallet_provider.get_network().network_id
 SUPPORTED_NETWORKS = ["ethereum-mainnet"]
 
+# Chain id (as reported by Network.chain_id) of each supported network key
+NETWORK_CHAIN_IDS = {"ethereum-mainnet": "1"}
+
 # === 2. Canonical contract addresses ===
 POSITION_MANAGER_ADDRESSES = {
     "ethereum-mainnet": Web3.to_checksum_address(
@@ -24,7 +30,18 @@ ASSET_ADDRESSES = {
     }
 }
 
-ASSET_DECIMALS = {"weth": 18, "usdc": 6}
+# Read-only views: these tables are shared by every caller and must not be mutated
+ASSET_DECIMALS: Final = MappingProxyType({"weth": 18, "usdc": 6})
+ASSET_SYMBOLS: Final = MappingProxyType({"weth": "WETH", "usdc": "USDC"})
+
+# Tick spacing per fee tier: 0.01% -> 1, 0.05% -> 10, 0.3% -> 60, 1% -> 200
+TICK_SPACING: Final = MappingProxyType({100: 1, 500: 10, 3000: 60, 10000: 200})
+
+# TickMath bounds: sqrt(1.0001^tick) * 2^96 at MIN_TICK / MAX_TICK
+MIN_TICK = -887272
+MAX_TICK = 887272
+MIN_SQRT_RATIO = 4295128739
+MAX_SQRT_RATIO = 1461446703485210103287273052203988822378723970342
 
 UNISWAP_V3_FACTORY_ADDRESS = {
     "ethereum-mainnet": Web3.to_checksum_address(
@@ -32,6 +49,13 @@ UNISWAP_V3_FACTORY_ADDRESS = {
     )
 }
 
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+MAX_UINT256 = (1 << 256) - 1
+
+# slot0 reads are reused for about one mainnet block
+SLOT0_CACHE_TTL_SECONDS = 12.0
+
 # Factory ABI to fetch pool address
 UNISWAP_V3_FACTORY_ABI = [
     {
@@ -124,3 +148,57 @@ UNISWAP_V3_POSITION_MANAGER_ABI = [
         "type": "function"
     }
 ]
+
+# NonfungiblePositionManager.mint(MintParams) – encoded directly, without a contract object
+MINT_PARAMS_TYPE = "(address,address,uint24,int24,int24,uint256,uint256,uint256,uint256,address,uint256)"
+MINT_SELECTOR = bytes(Web3.keccak(text=f"mint({MINT_PARAMS_TYPE})")[:4])  # 0x88316456
+
+# ERC721 Transfer(from, to, tokenId) emitted by the position manager; from == 0 on mint
+TRANSFER_EVENT_TOPIC = bytes(Web3.keccak(text="Transfer(address,address,uint256)"))
+ZERO_TOPIC = bytes(32)
+
+# === 3. Multicall3 – same address on every chain it is deployed to ===
+MULTICALL3_ADDRESS = Web3.to_checksum_address("0xca11bde05977b3631167028862be2a173976ca11")
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# ERC20 function selectors used to build Multicall3 sub-calls
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")  # balanceOf(address)
+ALLOWANCE_SELECTOR = bytes.fromhex("dd62ed3e")  # allowance(address,address)
+APPROVE_SELECTOR = bytes.fromhex("095ea7b3")  # approve(address,uint256)
+DECIMALS_SELECTOR = bytes.fromhex("313ce567")  # decimals()
+SYMBOL_SELECTOR = bytes.fromhex("95d89b41")  # symbol()
+
+# Uniswap V3 factory/pool selectors and return types used to build Multicall3 sub-calls
+GET_POOL_SELECTOR = bytes.fromhex("1698ee82")  # getPool(address,address,uint24)
+SLOT0_SELECTOR = bytes.fromhex("3850c7bd")  # slot0()
+SLOT0_OUTPUT_TYPES = ["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"]
@@ -26,17 +26,28 @@ class CreateLiquiditySchema(BaseModel):
     )
     fee_tier: int = Field(
         3000,
-        description="The fee tier to use (500 = 0.05%, 3000 = 0.3%, 10000 = 1%). Default is 0.3% (3000)",
+        description="The fee tier to use (100 = 0.01%, 500 = 0.05%, 3000 = 0.3%, 10000 = 1%). Default is 0.3% (3000)",
     )
     slippage: float = Field(
         0.5,
         description="Maximum allowed slippage in percentage (e.g., 0.5 for 0.5%). Default is 0.5%",
     )
+    unlimited_approval: bool = Field(
+        False,
+        description=(
+            "Approve the position manager for an unlimited amount, so later positions skip the "
+            "approval transactions. Default is False (approve exactly the deposited amounts)"
+        ),
+    )
 
 
 class GetPriceSchema(BaseModel):
     """Input schema for fetching current WETH/USDC price from Uniswap V3."""
     fee_tier: int = Field(
         3000,
-        description="The fee tier to use (500 = 0.05%, 3000 = 0.3%, 10000 = 1%). Default is 0.3% (3000)",
+        description="The fee tier to use (100 = 0.01%, 500 = 0.05%, 3000 = 0.3%, 10000 = 1%). Default is 0.3% (3000)",
     )
+
+
+class GetPricesAllTiersSchema(BaseModel):
+    """Input schema for fetching WETH/USDC prices from every Uniswap V3 fee tier (no arguments)."""
@@ -0,0 +1,55 @@
+"""Tests for reading the minted position NFT's tokenId from a mint receipt."""
+
+import pytest
+
+from coinbase_agentkit.action_providers.uniswap_v3.constants import (
+    ASSET_ADDRESSES,
+    POSITION_MANAGER_ADDRESSES,
+    TRANSFER_EVENT_TOPIC,
+    ZERO_TOPIC,
+)
+from coinbase_agentkit.action_providers.uniswap_v3.uniswap_v3_action_provider import (
+    _get_minted_token_id,
+)
+
+POSITION_MANAGER = POSITION_MANAGER_ADDRESSES["ethereum-mainnet"]
+OWNER_TOPIC = bytes(12) + bytes.fromhex("000000000000000000000000000000000000dEaD")
+POOL_TOPIC = bytes(12) + bytes.fromhex("88e6a0c2ddd26feeb64f039a2c41296fcb3f5640")
+# IncreaseLiquidity(uint256,uint128,uint256,uint256), emitted by the position manager next to the mint
+INCREASE_LIQUIDITY_TOPIC = bytes.fromhex("3067048beee31b25b2f1681f88dac838c8bba36af25bfb2b7cf7473a5847e35f")
+
+
+def _nft_transfer(token_id: int, from_topic: bytes = ZERO_TOPIC) -> dict:
+    """Build the position manager's ERC721 Transfer log for a tokenId."""
+    return {
+        "address": POSITION_MANAGER,
+        "topics": [TRANSFER_EVENT_TOPIC, from_topic, OWNER_TOPIC, token_id.to_bytes(32, "big")],
+    }
+
+
+# The ERC20 Transfer of USDC into the pool shares topic0 with the ERC721 Transfer, but has
+# only three topics and comes from the token contract
+USDC_TRANSFER = {
+    "address": ASSET_ADDRESSES["ethereum-mainnet"]["usdc"],
+    "topics": [TRANSFER_EVENT_TOPIC, OWNER_TOPIC, POOL_TOPIC],
+}
+INCREASE_LIQUIDITY = {
+    "address": POSITION_MANAGER,
+    "topics": [INCREASE_LIQUIDITY_TOPIC, (123_456).to_bytes(32, "big")],
+}
+
+
+@pytest.mark.parametrize(
+    ("logs", "expected"),
+    [
+        ([USDC_TRANSFER, _nft_transfer(123_456), INCREASE_LIQUIDITY], 123_456),
+        ([_nft_transfer(0)], 0),
+        ([_nft_transfer((1 << 256) - 1)], (1 << 256) - 1),
+        ([USDC_TRANSFER, INCREASE_LIQUIDITY], None),
+        ([_nft_transfer(7, from_topic=OWNER_TOPIC)], None),
+        ([], None),
+    ],
+)
+def test_get_minted_token_id(logs, expected):
+    """Test that only the position manager's Transfer from the zero address yields the tokenId."""
+    assert _get_minted_token_id(logs, POSITION_MANAGER) == expected
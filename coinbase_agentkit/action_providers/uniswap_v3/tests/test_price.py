@@ -0,0 +1,21 @@
+"""Tests for the Uniswap V3 WETH/USDC price quote."""
+
+import pytest
+
+from coinbase_agentkit.action_providers.uniswap_v3.uniswap_v3_action_provider import _format_price
+
+
+@pytest.mark.parametrize(
+    ("sqrt_root", "expected"),
+    [
+        # USDC is token0 and WETH token1, so the pool price is WETH wei per USDC unit:
+        # sqrtPriceX96 = sqrt_root * 2**96 means sqrt_root**2 wei per unit, i.e.
+        # 10**12 / sqrt_root**2 USDC per WETH
+        (10**6, "1.000000"),
+        (20_000, "2500.000000"),
+        (25_000, "1600.000000"),
+    ],
+)
+def test_format_price_quotes_usdc_per_weth(sqrt_root, expected):
+    """Test that the price is quoted as USDC per WETH, not inverted."""
+    assert _format_price(sqrt_root << 96) == expected
@@ -0,0 +1,137 @@
+"""Tests for reading token metadata and wallet state in one Multicall3 call."""
+
+from types import SimpleNamespace
+
+from eth_abi import encode
+import pytest
+from web3 import Web3
+
+from coinbase_agentkit.action_providers.uniswap_v3 import utils
+from coinbase_agentkit.action_providers.uniswap_v3.constants import (
+    ALLOWANCE_SELECTOR,
+    ASSET_ADDRESSES,
+    BALANCE_OF_SELECTOR,
+    DECIMALS_SELECTOR,
+    MULTICALL3_ADDRESS,
+    POSITION_MANAGER_ADDRESSES,
+    SYMBOL_SELECTOR,
+)
+
+OWNER = "0x000000000000000000000000000000000000dEaD"
+SPENDER = POSITION_MANAGER_ADDRESSES["ethereum-mainnet"]
+WETH = ASSET_ADDRESSES["ethereum-mainnet"]["weth"]
+DAI = "0x6b175474e89094c44da98b954eedeac495271d0f"
+MKR = "0x9f8f72aa9304c8b593d555f12ef6589cc3a579a2"
+BALANCE_OF = BALANCE_OF_SELECTOR + encode(["address"], [OWNER])
+ALLOWANCE = ALLOWANCE_SELECTOR + encode(["address", "address"], [OWNER, SPENDER])
+
+
+class StubWalletProvider:
+    """Wallet provider answering aggregate3 reads from a fixed table of return data."""
+
+    def __init__(self, return_data: dict[tuple[str, bytes], bytes | None]):
+        self.return_data = return_data
+        self.calls: list[list[tuple[str, bytes]]] = []
+
+    def get_network(self):
+        """Return a mainnet network."""
+        return SimpleNamespace(chain_id="1")
+
+    def get_address(self) -> str:
+        """Return the wallet address."""
+        return OWNER
+
+    def read_contract(self, contract_address, abi, function_name, args):
+        """Record an aggregate3 call and return (success, returnData) for each inner call."""
+        assert (contract_address, function_name) == (MULTICALL3_ADDRESS, "aggregate3")
+        calls = [(target, call_data) for target, allow_failure, call_data in args[0]]
+        self.calls.append(calls)
+        results = []
+        for call in calls:
+            data = self.return_data[call]
+            results.append((data is not None, data or b""))
+        return results
+
+
+@pytest.fixture(autouse=True)
+def token_metadata_cache(monkeypatch, tmp_path):
+    """Start every test from the hard-coded assets only, with the disk cache in tmp_path."""
+    monkeypatch.setattr(utils, "_TOKEN_DECIMALS", {})
+    monkeypatch.setattr(utils, "_TOKEN_SYMBOLS", {})
+    monkeypatch.setattr(utils, "_TOKEN_METADATA_CACHE_PATH", tmp_path / "token_meta.json")
+    utils._seed_known_asset_metadata()
+
+
+def _dai_return_data() -> dict[tuple[str, bytes], bytes]:
+    """Build the return data for reading DAI (uncached) and WETH (seeded) with an allowance."""
+    dai = Web3.to_checksum_address(DAI)
+    return {
+        (dai, DECIMALS_SELECTOR): encode(["uint8"], [18]),
+        (dai, SYMBOL_SELECTOR): encode(["string"], ["DAI"]),
+        (dai, BALANCE_OF): encode(["uint256"], [5 * 10**18]),
+        (dai, ALLOWANCE): encode(["uint256"], [0]),
+        (WETH, BALANCE_OF): encode(["uint256"], [10**18]),
+        (WETH, ALLOWANCE): encode(["uint256"], [2**256 - 1]),
+    }
+
+
+def test_fetch_token_context_reads_and_decodes_in_order():
+    """Test that metadata is read only for uncached tokens, before balance and allowance."""
+    dai = Web3.to_checksum_address(DAI)
+    wallet_provider = StubWalletProvider(_dai_return_data())
+
+    context = utils.fetch_token_context(wallet_provider, [DAI, WETH], SPENDER)
+
+    assert wallet_provider.calls == [
+        [
+            (dai, DECIMALS_SELECTOR),
+            (dai, SYMBOL_SELECTOR),
+            (dai, BALANCE_OF),
+            (dai, ALLOWANCE),
+            (WETH, BALANCE_OF),
+            (WETH, ALLOWANCE),
+        ]
+    ]
+    assert context == {
+        dai: {"decimals": 18, "symbol": "DAI", "balance": 5 * 10**18, "allowance": 0},
+        WETH: {"decimals": 18, "symbol": "WETH", "balance": 10**18, "allowance": 2**256 - 1},
+    }
+
+
+def test_fetch_token_context_caches_metadata():
+    """Test that fetched metadata is kept in memory and on disk and not read again."""
+    dai = Web3.to_checksum_address(DAI)
+    wallet_provider = StubWalletProvider(_dai_return_data())
+    utils.fetch_token_context(wallet_provider, [DAI], SPENDER)
+
+    context = utils.fetch_token_context(wallet_provider, [dai.lower()])
+
+    assert wallet_provider.calls[1] == [(dai, BALANCE_OF)]
+    assert context == {dai: {"decimals": 18, "symbol": "DAI", "balance": 5 * 10**18}}
+    assert utils._read_token_metadata_file()["1"][DAI] == {"d": 18, "s": "DAI"}
+
+
+def test_fetch_token_context_decodes_bytes32_symbol():
+    """Test tokens such as MKR whose symbol() returns bytes32 instead of string."""
+    mkr = Web3.to_checksum_address(MKR)
+    wallet_provider = StubWalletProvider(
+        {
+            (mkr, DECIMALS_SELECTOR): encode(["uint8"], [18]),
+            (mkr, SYMBOL_SELECTOR): b"MKR".ljust(32, b"\x00"),
+            (mkr, BALANCE_OF): encode(["uint256"], [7]),
+        }
+    )
+
+    context = utils.fetch_token_context(wallet_provider, [MKR])
+
+    assert context[mkr] == {"decimals": 18, "symbol": "MKR", "balance": 7}
+
+
+def test_fetch_token_context_rejects_reverted_reads():
+    """Test that a reverted read fails the whole fetch instead of returning partial state."""
+    return_data = _dai_return_data()
+    return_data[(WETH, ALLOWANCE)] = None
+    wallet_provider = StubWalletProvider(return_data)
+
+    with pytest.raises(ValueError, match="Could not read token state"):
+        utils.fetch_token_context(wallet_provider, [DAI, WETH], SPENDER)
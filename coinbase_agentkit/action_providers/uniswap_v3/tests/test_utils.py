@@ -0,0 +1,232 @@
+"""Tests for the Uniswap V3 action provider's pure helpers."""
+
+import random
+
+import pytest
+from web3 import Web3
+
+from coinbase_agentkit.action_providers.uniswap_v3.constants import (
+    ASSET_ADDRESSES,
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MAX_UINT256,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    UNISWAP_V3_POSITION_MANAGER_ABI,
+)
+from coinbase_agentkit.action_providers.uniswap_v3.utils import (
+    align_tick_range,
+    calculate_slippage_amounts,
+    encode_mint_calldata,
+    format_amount_from_decimals,
+    format_amount_with_decimals,
+    get_sqrt_ratio_at_tick,
+    get_tick_at_sqrt_ratio,
+)
+
+
+# Reference values from Uniswap v3-core's TickMath tests
+@pytest.mark.parametrize(
+    ("tick", "sqrt_price_x96"),
+    [
+        (MIN_TICK, MIN_SQRT_RATIO),
+        (-50, 79030349367926598376800521322),
+        (-1, 79224201403219477170569942574),
+        (0, 1 << 96),
+        (1, 79232123823359799118286999568),
+        (50, 79426470787362580746886972461),
+        (MAX_TICK, MAX_SQRT_RATIO),
+    ],
+)
+def test_get_sqrt_ratio_at_tick_matches_reference(tick, sqrt_price_x96):
+    """Test get_sqrt_ratio_at_tick against TickMath.getSqrtRatioAtTick."""
+    assert get_sqrt_ratio_at_tick(tick) == sqrt_price_x96
+
+
+@pytest.mark.parametrize("tick", [MIN_TICK - 1, MAX_TICK + 1])
+def test_get_sqrt_ratio_at_tick_out_of_range(tick):
+    """Test that ticks outside [MIN_TICK, MAX_TICK] are rejected."""
+    with pytest.raises(ValueError):
+        get_sqrt_ratio_at_tick(tick)
+
+
+def test_get_tick_at_sqrt_ratio_bounds():
+    """Test get_tick_at_sqrt_ratio at the edges of its domain."""
+    assert get_tick_at_sqrt_ratio(MIN_SQRT_RATIO) == MIN_TICK
+    assert get_tick_at_sqrt_ratio(MAX_SQRT_RATIO - 1) == MAX_TICK - 1
+    with pytest.raises(ValueError):
+        get_tick_at_sqrt_ratio(MIN_SQRT_RATIO - 1)
+    with pytest.raises(ValueError):
+        get_tick_at_sqrt_ratio(MAX_SQRT_RATIO)
+
+
+def test_tick_math_round_trip():
+    """Test that every sampled tick is the greatest tick whose sqrt ratio is <= its own."""
+    rng = random.Random(0)
+    for tick in [rng.randint(MIN_TICK + 1, MAX_TICK - 1) for _ in range(2000)]:
+        sqrt_price_x96 = get_sqrt_ratio_at_tick(tick)
+        assert get_tick_at_sqrt_ratio(sqrt_price_x96) == tick
+        assert get_tick_at_sqrt_ratio(sqrt_price_x96 - 1) == tick - 1
+
+
+@pytest.mark.parametrize(
+    ("amount", "decimals", "expected"),
+    [
+        ("1", 18, 10**18),
+        ("0.1", 6, 100_000),
+        ("1.", 6, 1_000_000),
+        ("1.1234567", 6, 1_123_456),
+        (".5", 6, 500_000),
+        ("+2", 6, 2_000_000),
+        ("-1.5", 6, -1_500_000),
+        (" 1 ", 6, 1_000_000),
+        ("1_000", 6, 1_000_000_000),
+    ],
+)
+def test_format_amount_with_decimals(amount, decimals, expected):
+    """Test converting human-readable amounts to atomic units."""
+    assert format_amount_with_decimals(amount, decimals) == expected
+
+
+@pytest.mark.parametrize("amount", ["", ".", "-", "abc", "1.2.3", "e5", "1e", ".e1", "1__0", "_1"])
+def test_format_amount_with_decimals_rejects_malformed(amount):
+    """Test that malformed amounts are rejected by the parser."""
+    with pytest.raises(ValueError, match="Invalid amount format"):
+        format_amount_with_decimals(amount, 6)
+
+
+@pytest.mark.parametrize(
+    ("amount", "decimals", "expected"),
+    [
+        ("1e-3", 6, 1_000),
+        ("1.5E2", 18, 150 * 10**18),
+        ("1.2345678e-5", 6, 12),
+        ("1e-100000000", 6, 0),
+        ("1e71", 6, 10**77),
+    ],
+)
+def test_format_amount_with_decimals_scientific(amount, decimals, expected):
+    """Test amounts in scientific notation, truncated towards zero."""
+    assert format_amount_with_decimals(amount, decimals) == expected
+
+
+@pytest.mark.parametrize("amount", ["1e72", "1e100000000", "1" + "0" * 80])
+def test_format_amount_with_decimals_rejects_out_of_range(amount):
+    """Test that amounts that cannot fit in a uint256 are rejected without being expanded."""
+    with pytest.raises(ValueError, match="Invalid amount format"):
+        format_amount_with_decimals(amount, 6)
+
+
+@pytest.mark.parametrize(
+    ("amount", "decimals", "expected"),
+    [
+        (0, 18, "0"),
+        (1, 18, "0.000000000000000001"),
+        (1_500_000, 6, "1.5"),
+        (10**18, 18, "1"),
+        (-123, 2, "-1.23"),
+        (5, 0, "5"),
+    ],
+)
+def test_format_amount_from_decimals(amount, decimals, expected):
+    """Test converting atomic units to human-readable amounts."""
+    assert format_amount_from_decimals(amount, decimals) == expected
+
+
+@pytest.mark.parametrize(
+    ("tick_lower", "tick_upper", "tick_spacing", "expected"),
+    [
+        # Full range is clamped to the usable range of each fee tier
+        (MIN_TICK, MAX_TICK, 1, (-887272, 887272)),
+        (MIN_TICK, MAX_TICK, 10, (-887270, 887270)),
+        (MIN_TICK, MAX_TICK, 60, (-887220, 887220)),
+        (MIN_TICK, MAX_TICK, 200, (-887200, 887200)),
+        # Both ticks at a bound still leave a one-spacing range inside it
+        (MAX_TICK, MAX_TICK, 60, (887160, 887220)),
+        (MIN_TICK, MIN_TICK, 60, (-887220, -887160)),
+        # An empty or inverted range is widened upwards by one spacing
+        (60, 60, 60, (60, 120)),
+        (120, 60, 60, (120, 180)),
+        # Ticks are floored, including negative ones
+        (-65, 65, 60, (-120, 60)),
+        (202545, 202645, 10, (202540, 202640)),
+        (-60000, 60000, 60, (-60000, 60000)),
+    ],
+)
+def test_align_tick_range(tick_lower, tick_upper, tick_spacing, expected):
+    """Test aligning a tick range to the spacing and the usable tick bounds."""
+    assert align_tick_range(tick_lower, tick_upper, tick_spacing) == expected
+
+
+@pytest.mark.parametrize(
+    "mint_params",
+    [
+        (
+            ASSET_ADDRESSES["ethereum-mainnet"]["usdc"],
+            ASSET_ADDRESSES["ethereum-mainnet"]["weth"],
+            3000,
+            -887220,
+            887220,
+            2_000_000_000,
+            10**18,
+            1_990_000_000,
+            995 * 10**15,
+            "0x000000000000000000000000000000000000dEaD",
+            1_700_000_000,
+        ),
+        (
+            ASSET_ADDRESSES["ethereum-mainnet"]["usdc"],
+            ASSET_ADDRESSES["ethereum-mainnet"]["weth"],
+            100,
+            -1,
+            0,
+            MAX_UINT256,
+            0,
+            MAX_UINT256,
+            0,
+            "0x000000000000000000000000000000000000dEaD",
+            MAX_UINT256,
+        ),
+    ],
+)
+def test_encode_mint_calldata_matches_web3(mint_params):
+    """Test that the precompiled MintParams encoder matches web3's contract encoding."""
+    contract = Web3().eth.contract(abi=UNISWAP_V3_POSITION_MANAGER_ABI)
+    expected = contract.functions.mint(mint_params)._encode_transaction_data()
+    calldata = encode_mint_calldata(mint_params)
+    assert calldata.startswith("0x88316456")
+    assert calldata == expected
+
+
+@pytest.mark.parametrize(
+    ("amount", "slippage_percentage", "bps", "expected"),
+    [
+        (10**18, 0.5, None, 995 * 10**15),
+        (10**18, None, 50, 995 * 10**15),
+        # 0.57 * 100 is 56.99999999999999 as a float; it must round to 57 bps, not truncate to 56
+        (1_000_000, 0.57, None, 994_300),
+        (999, 0.5, None, 994),
+        (MAX_UINT256, None, 1, MAX_UINT256 * 9_999 // 10_000),
+        (1_000_000, 0, None, 1_000_000),
+        (1_000_000, 100, None, 0),
+    ],
+)
+def test_calculate_slippage_amounts(amount, slippage_percentage, bps, expected):
+    """Test the minimum amount after slippage, computed exactly in basis points."""
+    assert calculate_slippage_amounts(amount, slippage_percentage, bps=bps) == expected
+
+
+@pytest.mark.parametrize(
+    ("slippage_percentage", "bps"),
+    [(-0.01, None), (100.01, None), (None, -1), (None, 10_001)],
+)
+def test_calculate_slippage_amounts_rejects_out_of_range(slippage_percentage, bps):
+    """Test that slippage outside 0% to 100% is rejected."""
+    with pytest.raises(ValueError, match="between 0 and 10000 bps"):
+        calculate_slippage_amounts(1_000_000, slippage_percentage, bps=bps)
+
+
+def test_calculate_slippage_amounts_requires_slippage():
+    """Test that either a percentage or basis points must be given."""
+    with pytest.raises(ValueError, match="Either slippage_percentage or bps"):
+        calculate_slippage_amounts(1_000_000)
@@ -1,7 +1,11 @@
 """Uniswap V3 action provider for interacting with Uniswap V3 protocol."""
 
-from typing import Any
+import logging
+import time
+from typing import Any, TypeVar
 
+from eth_abi import decode, encode
+from pydantic import BaseModel
 from web3 import Web3
 
 from ...network import Network
@@ -11,24 +15,101 @@ from ..action_provider import ActionProvider
 from .constants import (
     ASSET_ADDRESSES,
     ASSET_DECIMALS,
+    GET_POOL_SELECTOR,
+    MAX_UINT256,
     POSITION_MANAGER_ADDRESSES,
+    SLOT0_CACHE_TTL_SECONDS,
+    SLOT0_OUTPUT_TYPES,
+    SLOT0_SELECTOR,
     SUPPORTED_NETWORKS,
-    UNISWAP_V3_POSITION_MANAGER_ABI,
-    UNISWAP_V3_FACTORY_ADDRESS,
+    TICK_SPACING,
+    TRANSFER_EVENT_TOPIC,
     UNISWAP_V3_FACTORY_ABI,
+    UNISWAP_V3_FACTORY_ADDRESS,
     UNISWAP_V3_POOL_ABI,
+    ZERO_ADDRESS,
+    ZERO_TOPIC,
 )
-from .schemas import CreateLiquiditySchema, GetPriceSchema
+from .schemas import CreateLiquiditySchema, GetPricesAllTiersSchema, GetPriceSchema
 from .utils import (
-    approve_token,
+    aggregate_calls,
+    align_tick_range,
+    approve_token_if_needed,
     calculate_slippage_amounts,
+    encode_mint_calldata,
+    fetch_token_context,
     format_amount_from_decimals,
-    format_amount_with_decimals,
+    format_amounts_bulk,
     get_deadline,
-    get_token_balance,
     get_token_symbol,
 )
 
+logger = logging.getLogger(__name__)
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+# Pool addresses never change for a (network, fee tier) pair, so getPool is queried once per process
+_POOL_ADDRESSES: dict[tuple[str, int], str] = {}
+
+# Short-lived slot0 results keyed by pool address: (time.monotonic() of the read, slot0)
+_SLOT0_CACHE: dict[str, tuple[float, tuple]] = {}
+
+# USDC is token0 and WETH token1, so slot0 quotes raw WETH per raw USDC as (sqrtPriceX96 / 2**96)**2.
+# USDC per WETH = 2**192 * 10**(weth_decimals - usdc_decimals) / sqrtPriceX96**2, scaled by
+# 10**PRICE_DECIMALS so a single integer division keeps the displayed precision exactly.
+_PRICE_DECIMALS = 6
+_PRICE_NUMERATOR = (1 << 192) * 10 ** (
+    ASSET_DECIMALS["weth"] - ASSET_DECIMALS["usdc"] + _PRICE_DECIMALS
+)
+
+
+def _format_price(sqrt_price_x96: int) -> str:
+    """Format a WETH/USDC pool's sqrtPriceX96 as USDC per WETH with _PRICE_DECIMALS decimals."""
+    whole, fraction = divmod(_PRICE_NUMERATOR // (sqrt_price_x96 * sqrt_price_x96), 10**_PRICE_DECIMALS)
+    return f"{whole}.{fraction:0{_PRICE_DECIMALS}d}"
+
+
+def _get_minted_token_id(logs: list, position_manager_address: str) -> int | None:
+    """Find the position NFT's tokenId in a mint receipt's logs, or None if none was minted."""
+    for log in logs:
+        topics = log["topics"]
+        if (
+            log["address"] == position_manager_address
+            and len(topics) == 4
+            and topics[0] == TRANSFER_EVENT_TOPIC
+            and topics[1] == ZERO_TOPIC
+        ):
+            # The position NFT is minted from the zero address; tokenId is the third topic
+            return int.from_bytes(topics[3], "big")
+    return None
+
+
+def _unsupported_fee_tier(fee_tier: int) -> str:
+    """Build the error message for a fee tier without a Uniswap V3 tick spacing."""
+    supported = ", ".join(str(tier) for tier in TICK_SPACING)
+    return f"Error: Unsupported fee tier {fee_tier}. Use one of {supported}."
+
+
+def _parse_args(schema: type[SchemaT], args: dict[str, Any] | SchemaT) -> SchemaT:
+    """Validate action arguments, passing an already-validated schema instance through as-is."""
+    if isinstance(args, schema):
+        return args
+    return schema.model_validate(args)
+
+
+def _report_error(e: Exception) -> str:
+    """Log a failed create_liquidity call and build the message returned to the agent.
+
+    The failure is logged as an error; the traceback is only attached when debug logging is enabled.
+    """
+    logger.error(
+        "Error creating Uniswap V3 liquidity position: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG)
+    )
+    return (
+        f"Error creating Uniswap V3 liquidity position: {e!s}\n"
+        "Try using ticks that align with 0.05% fee tier spacing (10): tickLower=202540, tickUpper=202640"
+    )
+
 
 class UniswapV3ActionProvider(ActionProvider[EvmWalletProvider]):
     """Provides actions for interacting with Uniswap V3 protocol."""
@@ -85,6 +166,160 @@ class UniswapV3ActionProvider(ActionProvider[EvmWalletProvider]):
         except KeyError as err:
             raise ValueError(f"Asset {asset_id} not supported on {network.network_id}") from err
 
+    def _get_factory_address(self, network: Network) -> str:
+        """Get the Uniswap V3 factory address based on network."""
+        if network.chain_id == "1":
+            return UNISWAP_V3_FACTORY_ADDRESS["ethereum-mainnet"]
+        elif network.network_id in UNISWAP_V3_FACTORY_ADDRESS:
+            return UNISWAP_V3_FACTORY_ADDRESS[network.network_id]
+        else:
+            raise ValueError(f"No factory address available for network {network.network_id}")
+
+    def _get_pool_address(
+        self, wallet_provider: EvmWalletProvider, network: Network, fee_tier: int
+    ) -> str:
+        """Get the WETH/USDC pool address for a fee tier, querying the factory only on a cache miss.
+
+        Args:
+            wallet_provider: The wallet provider for reading from contracts.
+            network: The network the pool lives on.
+            fee_tier: The pool fee tier.
+
+        Returns:
+            str: The checksummed pool address, or the zero address if no pool exists.
+
+        """
+        cache_key = (network.network_id, fee_tier)
+        pool_address = _POOL_ADDRESSES.get(cache_key)
+        if pool_address is not None:
+            return pool_address
+
+        pool_address = wallet_provider.read_contract(
+            contract_address=self._get_factory_address(network),
+            abi=UNISWAP_V3_FACTORY_ABI,
+            function_name="getPool",
+            args=[
+                self._get_asset_address(network, "weth"),
+                self._get_asset_address(network, "usdc"),
+                fee_tier,
+            ],
+        )
+        if pool_address == ZERO_ADDRESS:
+            # Not cached: the pool may still be deployed later
+            return pool_address
+
+        pool_address = Web3.to_checksum_address(pool_address)
+        _POOL_ADDRESSES[cache_key] = pool_address
+        return pool_address
+
+    def _get_slot0(self, wallet_provider: EvmWalletProvider, pool_address: str) -> tuple:
+        """Read a pool's slot0, reusing a result younger than SLOT0_CACHE_TTL_SECONDS.
+
+        Args:
+            wallet_provider: The wallet provider for reading from contracts.
+            pool_address: The checksummed pool address.
+
+        Returns:
+            tuple: The slot0 values (sqrtPriceX96, tick, ...).
+
+        """
+        now = time.monotonic()
+        cached = _SLOT0_CACHE.get(pool_address)
+        if cached is not None and now - cached[0] < SLOT0_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        slot0 = tuple(
+            wallet_provider.read_contract(
+                contract_address=pool_address,
+                abi=UNISWAP_V3_POOL_ABI,
+                function_name="slot0",
+                args=[],
+            )
+        )
+        _SLOT0_CACHE[pool_address] = (now, slot0)
+        return slot0
+
+    def _get_pool_addresses(
+        self, wallet_provider: EvmWalletProvider, network: Network, fee_tiers: list[int]
+    ) -> dict[int, str]:
+        """Get the WETH/USDC pool addresses for several fee tiers with at most one Multicall3 read.
+
+        Args:
+            wallet_provider: The wallet provider for reading from contracts.
+            network: The network the pools live on.
+            fee_tiers: The pool fee tiers.
+
+        Returns:
+            dict: Fee tier -> checksummed pool address, or the zero address if no pool exists.
+
+        """
+        pool_addresses = {
+            fee_tier: _POOL_ADDRESSES[(network.network_id, fee_tier)]
+            for fee_tier in fee_tiers
+            if (network.network_id, fee_tier) in _POOL_ADDRESSES
+        }
+        missing = [fee_tier for fee_tier in fee_tiers if fee_tier not in pool_addresses]
+        if not missing:
+            return pool_addresses
+
+        factory_address = self._get_factory_address(network)
+        weth_address = self._get_asset_address(network, "weth")
+        usdc_address = self._get_asset_address(network, "usdc")
+        results = aggregate_calls(
+            wallet_provider,
+            [
+                (
+                    factory_address,
+                    GET_POOL_SELECTOR
+                    + encode(["address", "address", "uint24"], [weth_address, usdc_address, fee_tier]),
+                )
+                for fee_tier in missing
+            ],
+        )
+        for fee_tier, result in zip(missing, results, strict=True):
+            if result is None:
+                raise ValueError(f"getPool reverted for fee tier {fee_tier}")
+            pool_address = Web3.to_checksum_address(decode(["address"], result)[0])
+            if pool_address != ZERO_ADDRESS:
+                _POOL_ADDRESSES[(network.network_id, fee_tier)] = pool_address
+            pool_addresses[fee_tier] = pool_address
+        return pool_addresses
+
+    def _get_slot0s(
+        self, wallet_provider: EvmWalletProvider, pool_addresses: list[str]
+    ) -> dict[str, tuple | None]:
+        """Read several pools' slot0 with at most one Multicall3 read, honouring the slot0 cache.
+
+        Args:
+            wallet_provider: The wallet provider for reading from contracts.
+            pool_addresses: The checksummed pool addresses.
+
+        Returns:
+            dict: Pool address -> slot0 values, or None if the read returned nothing.
+
+        """
+        now = time.monotonic()
+        slot0s: dict[str, tuple | None] = {}
+        for pool_address in pool_addresses:
+            cached = _SLOT0_CACHE.get(pool_address)
+            if cached is not None and now - cached[0] < SLOT0_CACHE_TTL_SECONDS:
+                slot0s[pool_address] = cached[1]
+        missing = [pool_address for pool_address in pool_addresses if pool_address not in slot0s]
+        if not missing:
+            return slot0s
+
+        results = aggregate_calls(
+            wallet_provider, [(pool_address, SLOT0_SELECTOR) for pool_address in missing]
+        )
+        for pool_address, result in zip(missing, results, strict=True):
+            if not result:
+                slot0s[pool_address] = None
+                continue
+            slot0 = tuple(decode(SLOT0_OUTPUT_TYPES, result))
+            _SLOT0_CACHE[pool_address] = (now, slot0)
+            slot0s[pool_address] = slot0
+        return slot0s
+
     @create_action(
         name="create_liquidity",
         description="""
@@ -94,8 +329,9 @@ It takes:
 - amount_usdc: The amount of USDC to deposit (in human-readable format e.g., '1000')
 - tick_lower: The lower tick boundary (typically negative, e.g., -60000)
 - tick_upper: The upper tick boundary (typically positive, e.g., 60000)
-- fee_tier: (Optional) Fee tier to use (500=0.05%, 3000=0.3%, 10000=1%). Default is 0.3%
+- fee_tier: (Optional) Fee tier to use (100=0.01%, 500=0.05%, 3000=0.3%, 10000=1%). Default is 0.3%
 - slippage: (Optional) Maximum allowed slippage percentage. Default is 0.5%
+- unlimited_approval: (Optional) Approve an unlimited amount so later positions need no approvals. Default is false
 
 Important notes:
 - Make sure you have both WETH and USDC tokens in your wallet
@@ -106,19 +342,29 @@ Important notes:
 """,
         schema=CreateLiquiditySchema,
     )
-    def create_liquidity(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+    def create_liquidity(
+        self, wallet_provider: EvmWalletProvider, args: dict[str, Any] | CreateLiquiditySchema
+    ) -> str:
         """Create a liquidity position on Uniswap V3.
 
         Args:
             wallet_provider: The wallet to use for the create_liquidity operation.
-            args: The input arguments for the create_liquidity operation.
+            args: The input arguments for the create_liquidity operation, either raw or
+                already validated as a CreateLiquiditySchema.
 
         Returns:
             str: A message containing the result of the create_liquidity operation.
 
         """
         try:
-            validated_args = CreateLiquiditySchema(**args)
+            validated_args = _parse_args(CreateLiquiditySchema, args)
+
+            # Reject unknown fee tiers before any RPC, approval or (doomed) mint
+            fee_tier = validated_args.fee_tier
+            tick_spacing = TICK_SPACING.get(fee_tier)
+            if tick_spacing is None:
+                return _unsupported_fee_tier(fee_tier)
+
             network = wallet_provider.get_network()
 
             # Check if the network is supported
@@ -139,15 +385,23 @@ Important notes:
             except Exception as e:
                 return f"Error: Could not get asset addresses on {network.network_id}: {e!s}"
 
-            # Convert human-readable amounts to token units
-            weth_decimals = ASSET_DECIMALS["weth"]
-            usdc_decimals = ASSET_DECIMALS["usdc"]
-            amount_weth_units = format_amount_with_decimals(validated_args.amount_weth, weth_decimals)
-            amount_usdc_units = format_amount_with_decimals(validated_args.amount_usdc, usdc_decimals)
+            # Read decimals, balances and allowances for both tokens in a single Multicall3
+            # round trip (token metadata is only read the first time)
+            token_state = fetch_token_context(
+                wallet_provider, [weth_address, usdc_address], position_manager_address
+            )
+            weth_state = token_state[weth_address]
+            usdc_state = token_state[usdc_address]
 
-            # Check wallet balances
-            weth_balance = get_token_balance(wallet_provider, weth_address)
-            usdc_balance = get_token_balance(wallet_provider, usdc_address)
+            # Convert human-readable amounts to token units
+            weth_decimals = weth_state["decimals"]
+            usdc_decimals = usdc_state["decimals"]
+            amount_weth_units, amount_usdc_units = format_amounts_bulk(
+                [validated_args.amount_weth, validated_args.amount_usdc],
+                [weth_decimals, usdc_decimals],
+            )
+            weth_balance, weth_allowance = weth_state["balance"], weth_state["allowance"]
+            usdc_balance, usdc_allowance = usdc_state["balance"], usdc_state["allowance"]
 
             if weth_balance < amount_weth_units:
                 weth_formatted = format_amount_from_decimals(weth_balance, weth_decimals)
@@ -161,42 +415,35 @@ Important notes:
             amount_weth_min = calculate_slippage_amounts(amount_weth_units, validated_args.slippage)
             amount_usdc_min = calculate_slippage_amounts(amount_usdc_units, validated_args.slippage)
 
-            # Approve tokens for the position manager
-            try:
-                # Get balances
-                weth_balance = get_token_balance(wallet_provider, weth_address)
-                usdc_balance = get_token_balance(wallet_provider, usdc_address)
-
-                # Format amounts and log for debugging
-                weth_balance_formatted = format_amount_from_decimals(weth_balance, weth_decimals)
-                usdc_balance_formatted = format_amount_from_decimals(usdc_balance, usdc_decimals)
-
-                # Log balances for debugging
-                print(f"WETH balance: {weth_balance_formatted} WETH, USDC balance: {usdc_balance_formatted} USDC")
-                print(f"WETH needed: {validated_args.amount_weth}, USDC needed: {validated_args.amount_usdc}")
-
-                _ = approve_token(
-                    wallet_provider, weth_address, position_manager_address, amount_weth_units
+            # Log balances for debugging (only format them when debug logging is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "WETH balance: %s WETH, USDC balance: %s USDC",
+                    format_amount_from_decimals(weth_balance, weth_decimals),
+                    format_amount_from_decimals(usdc_balance, usdc_decimals),
+                )
+                logger.debug(
+                    "WETH needed: %s, USDC needed: %s",
+                    validated_args.amount_weth,
+                    validated_args.amount_usdc,
                 )
-            except Exception as e:
-                # Enhanced error logging
-                import traceback
-                error_details = traceback.format_exc()
-                detailed_error = f"Error creating Uniswap V3 liquidity position: {e!s}\n\nDetailed traceback:\n{error_details}"
-                print(detailed_error)  # Print to console for debugging
-                return f"Error creating Uniswap V3 liquidity position: {e!s}\nTry using ticks that align with 0.05% fee tier spacing (10): tickLower=202540, tickUpper=202640"
 
-            try:
-                _ = approve_token(
-                    wallet_provider, usdc_address, position_manager_address, amount_usdc_units
+            # Approve tokens for the position manager, skipping any existing allowance that
+            # already covers the deposit (always the case after an unlimited approval).
+            # Each approval is mined before the next is sent: wallet providers assign the
+            # nonce themselves, so a second in-flight approval would reuse the first's nonce.
+            for token, amount, allowance in (
+                (weth_address, amount_weth_units, weth_allowance),
+                (usdc_address, amount_usdc_units, usdc_allowance),
+            ):
+                approve_token_if_needed(
+                    wallet_provider,
+                    token,
+                    position_manager_address,
+                    amount,
+                    allowance=allowance,
+                    approve_amount=MAX_UINT256 if validated_args.unlimited_approval else None,
                 )
-            except Exception as e:
-                # Enhanced error logging
-                import traceback
-                error_details = traceback.format_exc()
-                detailed_error = f"Error creating Uniswap V3 liquidity position: {e!s}\n\nDetailed traceback:\n{error_details}"
-                print(detailed_error)  # Print to console for debugging
-                return f"Error creating Uniswap V3 liquidity position: {e!s}\nTry using ticks that align with 0.05% fee tier spacing (10): tickLower=202540, tickUpper=202640"
 
             # Based on mainnet addresses, USDC (0xA0b8...) < WETH (0xC02a...)
             # Therefore USDC is always token0 and WETH is token1
@@ -204,48 +451,20 @@ Important notes:
             amount0Desired, amount1Desired = amount_usdc_units, amount_weth_units
             amount0Min, amount1Min = amount_usdc_min, amount_weth_min
 
-            # Create mint params for the position
-            # Get the web3 instance from the wallet provider
-            web3_instance = wallet_provider.web3
-            
-            # Determine tick spacing based on fee tier
-            fee_tier = validated_args.fee_tier
-            if fee_tier == 500:
-                tick_spacing = 10   # 0.05% fee tier
-            elif fee_tier == 3000:
-                tick_spacing = 60   # 0.3% fee tier
-            elif fee_tier == 10000:
-                tick_spacing = 200  # 1% fee tier
-            else:
-                # Default to 0.05% fee tier
-                tick_spacing = 10
-                fee_tier = 500
-                print(f"Warning: Unsupported fee tier {validated_args.fee_tier}, defaulting to 0.05% (500)")
-            
-            lower_tick = validated_args.tick_lower
-            upper_tick = validated_args.tick_upper
-            
-            # Round to the nearest valid tick
-            lower_tick = (lower_tick // tick_spacing) * tick_spacing
-            upper_tick = (upper_tick // tick_spacing) * tick_spacing
-            
-            # Ensure upper tick is strictly greater than lower tick
-            if upper_tick <= lower_tick:
-                upper_tick = lower_tick + tick_spacing
-                
-            contract = web3_instance.eth.contract(
-                address=Web3.to_checksum_address(position_manager_address),
-                abi=UNISWAP_V3_POSITION_MANAGER_ABI,
+            # Round to valid ticks for the fee tier's spacing
+            lower_tick, upper_tick = align_tick_range(
+                validated_args.tick_lower, validated_args.tick_upper, tick_spacing
             )
 
             # Create a tuple of params instead of a dict - the ABI expects a tuple
             deadline = get_deadline()
             recipient = wallet_provider.get_address()
             
-            # Create the mint parameters tuple in the expected order
+            # Create the mint parameters tuple in the expected order.
+            # Addresses from constants and the wallet provider are already checksummed.
             mint_tuple = (
-                Web3.to_checksum_address(token0),
-                Web3.to_checksum_address(token1),
+                token0,
+                token1,
                 fee_tier,
                 lower_tick,
                 upper_tick,
@@ -257,120 +476,133 @@ Important notes:
                 deadline
             )
             
-            # Call mint with the tuple parameters
-            fn = contract.functions.mint(mint_tuple)
-            encoded_data = fn._encode_transaction_data()
+            # Encode mint(MintParams) with the precompiled encoder
+            encoded_data = encode_mint_calldata(mint_tuple)
 
             params = {
-                "to": Web3.to_checksum_address(position_manager_address),
+                "to": position_manager_address,
                 "data": encoded_data,
                 "gas": 3000000,  # Higher gas limit for complex contract interactions
                 # Let the wallet provider handle the gas pricing
             }
 
-            # Add debug logging
-            print(f"Transaction parameters:\n"
-                  f"- To: {position_manager_address}\n"
-                  f"- Token0: {token0}\n"
-                  f"- Token1: {token1}\n"
-                  f"- Fee: {fee_tier}\n"
-                  f"- TickLower: {lower_tick} (rounded to fee tier spacing)\n"
-                  f"- TickUpper: {upper_tick} (rounded to fee tier spacing)\n"
-                  f"- Amount0: {amount0Desired}\n"
-                  f"- Amount1: {amount1Desired}\n"
-                  f"- Slippage: {validated_args.slippage}%\n"
-                  f"- Deadline: {get_deadline()}")
+            # Add debug logging (formatted lazily, only if a handler emits it)
+            logger.debug(
+                "Transaction parameters:\n"
+                "- To: %s\n"
+                "- Token0: %s\n"
+                "- Token1: %s\n"
+                "- Fee: %s\n"
+                "- TickLower: %s (rounded to fee tier spacing)\n"
+                "- TickUpper: %s (rounded to fee tier spacing)\n"
+                "- Amount0: %s\n"
+                "- Amount1: %s\n"
+                "- Slippage: %s%%\n"
+                "- Deadline: %s",
+                position_manager_address,
+                token0,
+                token1,
+                fee_tier,
+                lower_tick,
+                upper_tick,
+                amount0Desired,
+                amount1Desired,
+                validated_args.slippage,
+                deadline,
+            )
 
-            try:
-                tx_hash = wallet_provider.send_transaction(params)
-                receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
-
-                if receipt.status != 1:
-                    return f"Error: Liquidity position creation failed. Transaction hash: {tx_hash}"
-
-                # Try to extract the token ID from the transaction logs
-                token_id = None
-                for log in receipt.logs:
-                    if log["address"].lower() == position_manager_address.lower() and len(log["topics"]) > 3:
-                        # This is likely the Transfer event for the new NFT
-                        token_id = int(log["topics"][3].hex(), 16)
-                        break
-
-                token_id_msg = f"\nPosition NFT ID: {token_id}" if token_id else ""
-
-                return (
-                    f"Successfully created Uniswap V3 liquidity position with:\n"
-                    f"- {validated_args.amount_weth} WETH\n"
-                    f"- {validated_args.amount_usdc} USDC\n"
-                    f"- Price range ticks: {lower_tick} to {upper_tick} (aligned with fee tier spacing)\n"
-                    f"- Fee tier: {fee_tier}\n"
-                    f"Transaction hash: {tx_hash}{token_id_msg}"
-                )
+            tx_hash = wallet_provider.send_transaction(params)
+            receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
 
-            except Exception as e:
-                # Enhanced error logging
-                import traceback
-                error_details = traceback.format_exc()
-                detailed_error = f"Error creating Uniswap V3 liquidity position: {e!s}\n\nDetailed traceback:\n{error_details}"
-                print(detailed_error)  # Print to console for debugging
-                return f"Error creating Uniswap V3 liquidity position: {e!s}\nTry using ticks that align with 0.05% fee tier spacing (10): tickLower=202540, tickUpper=202640"
+            if receipt.status != 1:
+                return f"Error: Liquidity position creation failed. Transaction hash: {tx_hash}"
+
+            token_id = _get_minted_token_id(receipt.logs, position_manager_address)
+            token_id_msg = f"\nPosition NFT ID: {token_id}" if token_id is not None else ""
+
+            return (
+                f"Successfully created Uniswap V3 liquidity position with:\n"
+                f"- {validated_args.amount_weth} WETH\n"
+                f"- {validated_args.amount_usdc} USDC\n"
+                f"- Price range ticks: {lower_tick} to {upper_tick} (aligned with fee tier spacing)\n"
+                f"- Fee tier: {fee_tier}\n"
+                f"Transaction hash: {tx_hash}{token_id_msg}"
+            )
 
         except Exception as e:
-            # Enhanced error logging
-            import traceback
-            error_details = traceback.format_exc()
-            detailed_error = f"Error creating Uniswap V3 liquidity position: {e!s}\n\nDetailed traceback:\n{error_details}"
-            print(detailed_error)  # Print to console for debugging
-            return f"Error creating Uniswap V3 liquidity position: {e!s}\nTry using ticks that align with 0.05% fee tier spacing (10): tickLower=202540, tickUpper=202640"
+            return _report_error(e)
 
     @create_action(
         name="get_price",
         description="""Fetch current WETH/USDC price from Uniswap V3 pool for a given fee tier.""",
         schema=GetPriceSchema,
     )
-    def get_price(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+    def get_price(
+        self, wallet_provider: EvmWalletProvider, args: dict[str, Any] | GetPriceSchema
+    ) -> str:
         """Fetch the current WETH/USDC price."""
-        validated_args = GetPriceSchema(**args)
+        validated_args = _parse_args(GetPriceSchema, args)
+        if validated_args.fee_tier not in TICK_SPACING:
+            return _unsupported_fee_tier(validated_args.fee_tier)
         network = wallet_provider.get_network()
         if not self.supports_network(network):
             return f"Error: Network {network.network_id} is not supported by Uniswap V3"
         try:
-            weth_address = self._get_asset_address(network, "weth")
-            usdc_address = self._get_asset_address(network, "usdc")
-        except Exception as e:
-            return f"Error: Could not get asset addresses: {e!s}"
-        factory_address = Web3.to_checksum_address(UNISWAP_V3_FACTORY_ADDRESS[network.network_id])
-        try:
-            pool_address = wallet_provider.read_contract(
-                contract_address=factory_address,
-                abi=UNISWAP_V3_FACTORY_ABI,
-                function_name="getPool",
-                args=[
-                    Web3.to_checksum_address(weth_address),
-                    Web3.to_checksum_address(usdc_address),
-                    validated_args.fee_tier
-                ],
-            )
+            pool_address = self._get_pool_address(wallet_provider, network, validated_args.fee_tier)
         except Exception as e:
             return f"Error: Failed to fetch pool address: {e!s}"
-        if pool_address == "0x0000000000000000000000000000000000000000":
+        if pool_address == ZERO_ADDRESS:
             return f"Error: No pool found for fee tier {validated_args.fee_tier}"
-        pool_address = Web3.to_checksum_address(pool_address)
         try:
-            slot0 = wallet_provider.read_contract(
-                contract_address=pool_address,
-                abi=UNISWAP_V3_POOL_ABI,
-                function_name="slot0",
-                args=[],
-            )
+            slot0 = self._get_slot0(wallet_provider, pool_address)
         except Exception as e:
             return f"Error fetching pool state (slot0): {e!s}"
         sqrt_price_x96, current_tick = slot0[0], slot0[1]
-        decimals_weth = ASSET_DECIMALS["weth"]
-        decimals_usdc = ASSET_DECIMALS["usdc"]
-        price_ratio = (sqrt_price_x96 / (2**96)) ** 2
-        price = price_ratio * (10 ** (decimals_weth - decimals_usdc))
-        return f"Current WETH/USDC price: {price:.6f} USDC per WETH (tick: {current_tick})"
+        if sqrt_price_x96 == 0:
+            return f"Error: Pool for fee tier {validated_args.fee_tier} is not initialized"
+        price = _format_price(sqrt_price_x96)
+        return f"Current WETH/USDC price: {price} USDC per WETH (tick: {current_tick})"
+
+    @create_action(
+        name="get_prices_all_tiers",
+        description="""Fetch current WETH/USDC prices from the Uniswap V3 pools of every fee tier (100, 500, 3000 and 10000) at once.""",
+        schema=GetPricesAllTiersSchema,
+    )
+    def get_prices_all_tiers(
+        self, wallet_provider: EvmWalletProvider, args: dict[str, Any] | GetPricesAllTiersSchema
+    ) -> str:
+        """Fetch the current WETH/USDC price of every fee tier, batching the reads through Multicall3."""
+        _parse_args(GetPricesAllTiersSchema, args)
+        network = wallet_provider.get_network()
+        if not self.supports_network(network):
+            return f"Error: Network {network.network_id} is not supported by Uniswap V3"
+        fee_tiers = list(TICK_SPACING)
+        try:
+            pool_addresses = self._get_pool_addresses(wallet_provider, network, fee_tiers)
+        except Exception as e:
+            return f"Error: Failed to fetch pool addresses: {e!s}"
+        try:
+            slot0s = self._get_slot0s(
+                wallet_provider,
+                [pool_address for pool_address in pool_addresses.values() if pool_address != ZERO_ADDRESS],
+            )
+        except Exception as e:
+            return f"Error fetching pool state (slot0): {e!s}"
+
+        lines = ["Current WETH/USDC prices on Uniswap V3:"]
+        for fee_tier in fee_tiers:
+            pool_address = pool_addresses[fee_tier]
+            if pool_address == ZERO_ADDRESS:
+                lines.append(f"- Fee tier {fee_tier}: No pool found")
+                continue
+            slot0 = slot0s[pool_address]
+            if slot0 is None or slot0[0] == 0:
+                lines.append(f"- Fee tier {fee_tier}: Pool is not initialized")
+                continue
+            lines.append(
+                f"- Fee tier {fee_tier}: {_format_price(slot0[0])} USDC per WETH (tick: {slot0[1]})"
+            )
+        return "\n".join(lines)
 
 
 def uniswap_v3_action_provider() -> UniswapV3ActionProvider:
@@ -1,18 +1,197 @@
 """Utility functions for Uniswap V3 action provider."""
 
-from decimal import Decimal
+from contextlib import suppress
+from functools import lru_cache
+import json
+import os
+from pathlib import Path
+import re
+import tempfile
 import time
+import weakref
 
+from eth_abi import decode, encode
+from eth_abi.registry import registry
 from web3 import Web3
 
 from ...wallet_providers import EvmWalletProvider
 from ..erc20.constants import ERC20_ABI
-from .constants import ASSET_DECIMALS
+from .constants import (
+    ALLOWANCE_SELECTOR,
+    APPROVE_SELECTOR,
+    ASSET_ADDRESSES,
+    ASSET_DECIMALS,
+    ASSET_SYMBOLS,
+    BALANCE_OF_SELECTOR,
+    DECIMALS_SELECTOR,
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MAX_UINT256,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    MINT_PARAMS_TYPE,
+    MINT_SELECTOR,
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
+    NETWORK_CHAIN_IDS,
+    SYMBOL_SELECTOR,
+)
+
+# MintParams is a fixed, fully static struct: build its encoder once instead of per call
+_MINT_PARAMS_ENCODER = registry.get_encoder(MINT_PARAMS_TYPE)
+
+# TickMath.getSqrtRatioAtTick: Q128.128 factors 1/sqrt(1.0001)^bit for each bit of |tick| above the first
+_SQRT_RATIO_FACTORS = (
+    (0x2, 0xFFF97272373D413259A46990580E213A),
+    (0x4, 0xFFF2E50F5F656932EF12357CF3C7FDCC),
+    (0x8, 0xFFE5CACA7E10E4E61C3624EAA0941CD0),
+    (0x10, 0xFFCB9843D60F6159C9DB58835C926644),
+    (0x20, 0xFF973B41FA98C081472E6896DFB254C0),
+    (0x40, 0xFF2EA16466C96A3843EC78B326B52861),
+    (0x80, 0xFE5DEE046A99A2A811C461F1969C3053),
+    (0x100, 0xFCBE86C7900A88AEDCFFC83B479AA3A4),
+    (0x200, 0xF987A7253AC413176F2B074CF7815E54),
+    (0x400, 0xF3392B0822B70005940C7A398E4B70F3),
+    (0x800, 0xE7159475A2C29B7443B29C7FA6E889D9),
+    (0x1000, 0xD097F3BDFD2022B8845AD8F792AA5825),
+    (0x2000, 0xA9F746462D870FDF8A65DC1F90E061E5),
+    (0x4000, 0x70D869A156D2A1B890BB3DF62BAF32F7),
+    (0x8000, 0x31BE135F97D08FD981231505542FCFA6),
+    (0x10000, 0x9AA508B5B7A84E1C677DE54F3E99BC9),
+    (0x20000, 0x5D6AF8DEDB81196699C329225EE604),
+    (0x40000, 0x2216E584F5FA1EA926041BEDFE98),
+    (0x80000, 0x48A170391F7DC42444E8FA2),
+)
+
+# EIP-55 checksumming hashes the address with keccak256: do it once per distinct address
+_checksum = lru_cache(maxsize=4096)(Web3.to_checksum_address)
+
+# Sign, whole digits, fraction digits and exponent of a human-readable amount ("1.5", ".5",
+# "2e-3", "1_000"); digit groups may use single underscores, as int() and Decimal() accept
+_AMOUNT_RE = re.compile(
+    r"([+-]?)(?=\.?\d)((?:\d(?:_?\d)*)?)(?:\.((?:\d(?:_?\d)*)?))?(?:[eE]([+-]?\d+))?\Z"
+)
+
+# Powers of ten for every possible decimals() value (a uint8), indexed instead of recomputed
+_POW10 = tuple(10**i for i in range(256))
+
+# 10**77 is the largest power of ten that fits in a uint256
+_MAX_UINT256_POW10_EXPONENT = 77
+
+
+# decimals() and symbol() never change for a deployed token: cache them per (chain_id, token address)
+_TOKEN_DECIMALS: dict[tuple[str, str], int] = {}
+_TOKEN_SYMBOLS: dict[tuple[str, str], str] = {}
+
+# On-disk copy of the token metadata, so one-shot agent runs don't re-fetch it on every start.
+# Layout: {chain_id: {lowercase token address: {"d": decimals, "s": symbol}}}
+_TOKEN_METADATA_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "coinbase_agentkit"
+    / "token_meta.json"
+)
+
+
+def _read_token_metadata_file() -> dict:
+    """Read the on-disk token metadata cache, treating a missing or corrupt file as empty."""
+    try:
+        with open(_TOKEN_METADATA_CACHE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _load_token_metadata_cache() -> None:
+    """Populate the in-memory token metadata caches from disk."""
+    for chain_id, tokens in _read_token_metadata_file().items():
+        if not isinstance(tokens, dict):
+            continue
+        for address, metadata in tokens.items():
+            try:
+                cache_key = (chain_id, _checksum(address))
+            except ValueError:
+                continue
+            if not isinstance(metadata, dict):
+                continue
+            if isinstance(metadata.get("d"), int):
+                _TOKEN_DECIMALS[cache_key] = metadata["d"]
+            if isinstance(metadata.get("s"), str):
+                _TOKEN_SYMBOLS[cache_key] = metadata["s"]
+
+
+def _save_token_metadata_cache() -> None:
+    """Merge the in-memory token metadata into the on-disk cache, replacing the file atomically.
+
+    Failures are ignored: the disk cache is only an optimisation.
+    """
+    data = _read_token_metadata_file()
+
+    def entry(chain_id: str, address: str) -> dict:
+        tokens = data.get(chain_id)
+        if not isinstance(tokens, dict):
+            tokens = data[chain_id] = {}
+        metadata = tokens.get(address.lower())
+        if not isinstance(metadata, dict):
+            metadata = tokens[address.lower()] = {}
+        return metadata
+
+    # Iterate over snapshots: another thread may be adding entries to the caches meanwhile
+    for (chain_id, address), decimals in list(_TOKEN_DECIMALS.items()):
+        entry(chain_id, address)["d"] = decimals
+    for (chain_id, address), symbol in list(_TOKEN_SYMBOLS.items()):
+        entry(chain_id, address)["s"] = symbol
+
+    try:
+        _TOKEN_METADATA_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_TOKEN_METADATA_CACHE_PATH.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, _TOKEN_METADATA_CACHE_PATH)
+    except OSError:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+
+
+def _seed_known_asset_metadata() -> None:
+    """Fill the token metadata caches with the hard-coded assets, so they never need an RPC."""
+    for network_id, assets in ASSET_ADDRESSES.items():
+        chain_id = NETWORK_CHAIN_IDS[network_id]
+        for asset_id, address in assets.items():
+            _TOKEN_DECIMALS[(chain_id, address)] = ASSET_DECIMALS[asset_id]
+            _TOKEN_SYMBOLS[(chain_id, address)] = ASSET_SYMBOLS[asset_id]
+
+
+_load_token_metadata_cache()
+_seed_known_asset_metadata()
+
+# Wallet address per provider instance, dropped together with the provider
+_OWNER_ADDRESSES: "weakref.WeakKeyDictionary[EvmWalletProvider, str]" = weakref.WeakKeyDictionary()
+
+
+def _owner(wallet_provider: EvmWalletProvider) -> str:
+    """Get the wallet's address, asking the provider only the first time."""
+    address = _OWNER_ADDRESSES.get(wallet_provider)
+    if address is None:
+        address = _OWNER_ADDRESSES[wallet_provider] = wallet_provider.get_address()
+    return address
+
+
+def _decode_uint(data: bytes) -> int:
+    """Decode a single uint return value (e.g. decimals(), balanceOf()) without the ABI decoder."""
+    if len(data) < 32:
+        raise ValueError(f"Expected a 32-byte uint return value, got {len(data)} bytes")
+    return int.from_bytes(data[:32], "big")
 
 
 def get_token_decimals(wallet_provider: EvmWalletProvider, token_address: str) -> int:
     """Get the number of decimals for a token.
 
+    The value is read from the chain once per (chain_id, token) and cached for the process.
+
     Args:
         wallet_provider: The wallet provider for reading from contracts.
         token_address: The address of the token.
@@ -21,18 +200,26 @@ def get_token_decimals(wallet_provider: EvmWalletProvider, token_address: str) -
         int: The number of decimals for the token.
 
     """
-    result = wallet_provider.read_contract(
-        contract_address=Web3.to_checksum_address(token_address),
-        abi=ERC20_ABI,
-        function_name="decimals",
-        args=[],
-    )
-    return result
+    token_address = _checksum(token_address)
+    cache_key = (wallet_provider.get_network().chain_id, token_address)
+    decimals = _TOKEN_DECIMALS.get(cache_key)
+    if decimals is None:
+        decimals = wallet_provider.read_contract(
+            contract_address=token_address,
+            abi=ERC20_ABI,
+            function_name="decimals",
+            args=[],
+        )
+        _TOKEN_DECIMALS[cache_key] = decimals
+        _save_token_metadata_cache()
+    return decimals
 
 
 def get_token_symbol(wallet_provider: EvmWalletProvider, token_address: str) -> str:
     """Get a token's symbol from its contract.
 
+    The value is read from the chain once per (chain_id, token) and cached for the process.
+
     Args:
         wallet_provider: The wallet provider for reading from contracts.
         token_address: The address of the token contract.
@@ -41,17 +228,28 @@ def get_token_symbol(wallet_provider: EvmWalletProvider, token_address: str) ->
         str: The token symbol.
 
     """
-    return wallet_provider.read_contract(
-        contract_address=Web3.to_checksum_address(token_address),
-        abi=ERC20_ABI,
-        function_name="symbol",
-        args=[],
-    )
+    token_address = _checksum(token_address)
+    cache_key = (wallet_provider.get_network().chain_id, token_address)
+    symbol = _TOKEN_SYMBOLS.get(cache_key)
+    if symbol is None:
+        symbol = wallet_provider.read_contract(
+            contract_address=token_address,
+            abi=ERC20_ABI,
+            function_name="symbol",
+            args=[],
+        )
+        _TOKEN_SYMBOLS[cache_key] = symbol
+        _save_token_metadata_cache()
+    return symbol
 
 
 def format_amount_with_decimals(amount: str, decimals: int) -> int:
     """Format a human-readable amount with the correct number of decimals.
 
+    Surrounding whitespace is ignored. Besides plain decimals ("1", "0.1", "1."), a sign
+    ("+2", "-1.5"), a missing whole part (".5"), scientific notation ("1e-3") and underscores
+    between digits ("1_000") are accepted.
+
     Args:
         amount: The amount as a string (e.g. "0.1").
         decimals: The number of decimals for the token.
@@ -59,27 +257,51 @@ def format_amount_with_decimals(amount: str, decimals: int) -> int:
     Returns:
         int: The amount in atomic units.
 
+    Raises:
+        ValueError: If the amount is not a (possibly signed, possibly scientific) decimal number.
+
     """
+    match = _AMOUNT_RE.match(amount.strip())
+    if match is None:
+        raise ValueError(f"Invalid amount format: {amount}")
+    sign, whole, fraction, exponent = match.groups()
+
+    # digits * 10**(decimals + exponent - fraction length), all in integers
+    fraction = (fraction or "").replace("_", "")
+    digits = whole.replace("_", "") + fraction
     try:
-        # Handle scientific notation
-        if "e" in amount.lower():
-            amount_decimal = Decimal(amount)
-            return int(amount_decimal * (10**decimals))
-
-        # Handle regular decimal notation
-        parts = amount.split(".")
-        if len(parts) == 1:
-            return int(parts[0]) * (10**decimals)
-
-        whole, fraction = parts
-        if len(fraction) > decimals:
-            fraction = fraction[:decimals]
+        shift = decimals + int(exponent or 0) - len(fraction)
+        # Reject exponents that cannot give a uint256 before computing any huge power of ten
+        if shift > _MAX_UINT256_POW10_EXPONENT:
+            raise ValueError(f"Amount exponent out of range: {shift}")
+        if shift >= 0:
+            atomic = int(digits) * _POW10[shift]
         else:
-            fraction = fraction.ljust(decimals, "0")
-
-        return int(whole) * (10**decimals) + int(fraction)
+            # A negative shift truncates the digits below one atomic unit
+            atomic = int(digits[:shift] or "0")
+        if atomic > MAX_UINT256:
+            raise ValueError("Amount does not fit in a uint256")
     except ValueError as e:
         raise ValueError(f"Invalid amount format: {amount}") from e
+    return -atomic if sign == "-" else atomic
+
+
+def format_amounts_bulk(amounts: list[str], decimals: list[int]) -> list[int]:
+    """Convert several human-readable amounts to atomic units in one call.
+
+    Args:
+        amounts: The amounts as strings (e.g. "0.1").
+        decimals: The number of decimals of each amount's token.
+
+    Returns:
+        list: The amounts in atomic units, in the same order.
+
+    Raises:
+        ValueError: If an amount is malformed or the lists differ in length.
+
+    """
+    convert = format_amount_with_decimals
+    return [convert(amount, token_decimals) for amount, token_decimals in zip(amounts, decimals, strict=True)]
 
 
 def format_amount_from_decimals(amount: int, decimals: int) -> str:
@@ -93,18 +315,25 @@ def format_amount_from_decimals(amount: int, decimals: int) -> str:
         str: The amount as a human-readable string.
 
     """
-    if amount == 0:
-        return "0"
+    sign = "-" if amount < 0 else ""
+    whole, fraction = divmod(abs(amount), _POW10[decimals])
+    if fraction == 0:
+        return f"{sign}{whole}"
 
-    amount_decimal = Decimal(amount) / (10**decimals)
-    # Format to remove trailing zeros and decimal point if whole number
-    s = str(amount_decimal)
-    return s.rstrip("0").rstrip(".") if "." in s else s
+    # Pad the fraction to the full number of decimals, then drop trailing zeros
+    return f"{sign}{whole}.{str(fraction).zfill(decimals).rstrip('0')}"
 
 
-def approve_token(wallet_provider: EvmWalletProvider, token_address: str, spender_address: str, amount: int) -> str:
+def approve_token(
+    wallet_provider: EvmWalletProvider,
+    token_address: str,
+    spender_address: str,
+    amount: int,
+) -> str:
     """Approve a token for spending by Uniswap V3 Position Manager contract.
 
+    Waits for the approval to be mined, so a following transaction gets the next nonce.
+
     Args:
         wallet_provider: The wallet provider for sending transactions.
         token_address: The address of the token to approve.
@@ -115,15 +344,14 @@ def approve_token(wallet_provider: EvmWalletProvider, token_address: str, spende
         str: Transaction hash of the approval transaction.
 
     """
-    token_contract = Web3().eth.contract(
-        address=Web3.to_checksum_address(token_address), abi=ERC20_ABI
-    )
-    encoded_data = token_contract.encode_abi(
-        "approve", args=[Web3.to_checksum_address(spender_address), amount]
-    )
+    token_address = _checksum(token_address)
+    spender_address = _checksum(spender_address)
+
+    # Encode approve(spender, amount) directly rather than through a throwaway Web3 contract
+    encoded_data = Web3.to_hex(APPROVE_SELECTOR + encode(["address", "uint256"], [spender_address, amount]))
 
     params = {
-        "to": Web3.to_checksum_address(token_address),
+        "to": token_address,
         "data": encoded_data,
     }
 
@@ -132,28 +360,214 @@ def approve_token(wallet_provider: EvmWalletProvider, token_address: str, spende
     return tx_hash
 
 
-def calculate_slippage_amounts(amount: int, slippage_percentage: float) -> int:
+def approve_token_if_needed(
+    wallet_provider: EvmWalletProvider,
+    token_address: str,
+    spender_address: str,
+    amount: int,
+    allowance: int | None = None,
+    approve_amount: int | None = None,
+) -> str | None:
+    """Approve a token only if the spender's current allowance does not cover the amount.
+
+    The allowance is not cached between calls: it goes down whenever the spender uses it.
+
+    Args:
+        wallet_provider: The wallet provider for reading from contracts and sending transactions.
+        token_address: The address of the token to approve.
+        spender_address: The address of the spender (Position Manager contract).
+        amount: The amount the spender needs, in atomic units.
+        allowance: (Optional) The current allowance, if already read (e.g. by fetch_token_context).
+        approve_amount: (Optional) The amount to approve, e.g. MAX_UINT256. Defaults to amount.
+
+    Returns:
+        str | None: Transaction hash of the approval, or None if no approval was needed.
+
+    """
+    token_address = _checksum(token_address)
+    spender_address = _checksum(spender_address)
+    if allowance is None:
+        allowance = wallet_provider.read_contract(
+            contract_address=token_address,
+            abi=ERC20_ABI,
+            function_name="allowance",
+            args=[_owner(wallet_provider), spender_address],
+        )
+    if allowance >= amount:
+        return None
+    return approve_token(
+        wallet_provider,
+        token_address,
+        spender_address,
+        amount if approve_amount is None else approve_amount,
+    )
+
+
+def encode_mint_calldata(mint_params: tuple) -> str:
+    """Encode a NonfungiblePositionManager.mint(MintParams) call.
+
+    Args:
+        mint_params: The MintParams tuple (token0, token1, fee, tickLower, tickUpper,
+            amount0Desired, amount1Desired, amount0Min, amount1Min, recipient, deadline).
+
+    Returns:
+        str: The hex-encoded transaction data.
+
+    """
+    return "0x" + (MINT_SELECTOR + _MINT_PARAMS_ENCODER(mint_params)).hex()
+
+
+def calculate_slippage_amounts(
+    amount: int, slippage_percentage: float | None = None, *, bps: int | None = None
+) -> int:
     """Calculate minimum amount based on slippage percentage.
 
+    The result is computed with integer basis-point math, so large amounts keep full precision.
+
     Args:
         amount: The desired amount in atomic units.
         slippage_percentage: The allowed slippage percentage (e.g., 0.5 for 0.5%).
+        bps: The allowed slippage in basis points (e.g., 50 for 0.5%), instead of a percentage.
 
     Returns:
         int: The minimum amount after applying slippage.
 
+    Raises:
+        ValueError: If neither slippage_percentage nor bps is given, or the slippage is not
+            between 0% and 100%.
+
+    """
+    if bps is None:
+        if slippage_percentage is None:
+            raise ValueError("Either slippage_percentage or bps is required")
+        bps = round(slippage_percentage * 100)
+    if not 0 <= bps <= 10_000:
+        raise ValueError(f"Slippage must be between 0 and 10000 bps (0% to 100%), got {bps} bps")
+    return amount * (10_000 - bps) // 10_000
+
+
+def align_tick(tick: int, tick_spacing: int) -> int:
+    """Round a tick down to the nearest multiple of the tick spacing.
+
+    Python's modulo takes the sign of the divisor, so this floors negative ticks as well.
+
+    Args:
+        tick: The tick to align.
+        tick_spacing: The tick spacing of the pool's fee tier.
+
+    Returns:
+        int: The aligned tick.
+
+    """
+    return tick - tick % tick_spacing
+
+
+def align_tick_range(tick_lower: int, tick_upper: int, tick_spacing: int) -> tuple[int, int]:
+    """Align a position's tick range to the tick spacing and keep it mintable.
+
+    Both ticks are rounded down to the spacing and clamped to the usable range
+    [MIN_TICK, MAX_TICK] rounded inwards, so e.g. -887272..887272 becomes the full range
+    for the fee tier instead of an out-of-bounds tick that would revert the mint.
+
+    Args:
+        tick_lower: The requested lower tick.
+        tick_upper: The requested upper tick.
+        tick_spacing: The tick spacing of the pool's fee tier.
+
+    Returns:
+        tuple: The aligned (lower, upper) ticks, with upper strictly greater than lower.
+
+    """
+    max_usable_tick = MAX_TICK - MAX_TICK % tick_spacing
+    lower = min(max(align_tick(tick_lower, tick_spacing), -max_usable_tick), max_usable_tick - tick_spacing)
+    upper = min(max(align_tick(tick_upper, tick_spacing), -max_usable_tick), max_usable_tick)
+
+    # Ensure upper tick is strictly greater than lower tick
+    if upper <= lower:
+        upper = lower + tick_spacing
+    return lower, upper
+
+
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """Compute sqrt(1.0001^tick) * 2^96 exactly as Uniswap's TickMath.getSqrtRatioAtTick does.
+
+    Args:
+        tick: The tick, between MIN_TICK and MAX_TICK.
+
+    Returns:
+        int: The sqrt price as a Q64.96 number.
+
+    Raises:
+        ValueError: If the tick is out of range.
+
+    """
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise ValueError(f"Tick {tick} is outside [{MIN_TICK}, {MAX_TICK}]")
+
+    ratio = 0xFFFCB933BD6FAD37AA2D162D1A594001 if abs_tick & 0x1 else 1 << 128
+    for bit, factor in _SQRT_RATIO_FACTORS:
+        if abs_tick & bit:
+            ratio = (ratio * factor) >> 128
+    if tick > 0:
+        ratio = MAX_UINT256 // ratio
+
+    # Q128.128 -> Q64.96, rounding up so that get_tick_at_sqrt_ratio round-trips
+    return (ratio >> 32) + (1 if ratio & 0xFFFFFFFF else 0)
+
+
+@lru_cache(maxsize=1024)
+def get_tick_at_sqrt_ratio(sqrt_price_x96: int) -> int:
+    """Get the greatest tick whose sqrt ratio is <= sqrt_price_x96 (TickMath.getTickAtSqrtRatio).
+
+    Uses the reference bit-scan log2 instead of floating-point logarithms, so the result is exact.
+
+    Args:
+        sqrt_price_x96: The sqrt price as a Q64.96 number, e.g. slot0's sqrtPriceX96.
+
+    Returns:
+        int: The tick.
+
+    Raises:
+        ValueError: If the sqrt price is outside [MIN_SQRT_RATIO, MAX_SQRT_RATIO).
+
     """
-    slippage_factor = 1 - (slippage_percentage / 100.0)
-    return int(amount * slippage_factor)
+    if not MIN_SQRT_RATIO <= sqrt_price_x96 < MAX_SQRT_RATIO:
+        raise ValueError(f"Sqrt price {sqrt_price_x96} is out of range")
 
+    ratio = sqrt_price_x96 << 32
+    msb = ratio.bit_length() - 1
+    r = ratio >> (msb - 127) if msb >= 128 else ratio << (127 - msb)
 
-def get_deadline() -> int:
-    """Get transaction deadline timestamp (30 minutes from now).
+    # Integer part of log2 from the msb, then 14 fractional bits by repeated squaring
+    log_2 = (msb - 128) << 64
+    for shift in range(63, 49, -1):
+        r = (r * r) >> 127
+        f = r >> 128
+        log_2 |= f << shift
+        r >>= f
+
+    log_sqrt10001 = log_2 * 255738958999603826347141  # log2 -> log_sqrt(1.0001), Q128.128
+    tick_low = (log_sqrt10001 - 3402992956809132418596140100660247210) >> 128
+    tick_high = (log_sqrt10001 + 291339464771989622907027621153398088495) >> 128
+    if tick_low == tick_high:
+        return tick_low
+    return tick_high if get_sqrt_ratio_at_tick(tick_high) <= sqrt_price_x96 else tick_low
+
+
+def get_deadline(offset: int = 1800, now: int | None = None) -> int:
+    """Get transaction deadline timestamp (30 minutes from now by default).
+
+    Args:
+        offset: Seconds from now until the deadline.
+        now: (Optional) The current Unix timestamp, so one action can share a single sample.
 
     Returns:
         int: Unix timestamp for deadline.
     """
-    return int(time.time()) + 1800  # 30 minutes
+    if now is None:
+        now = time.time_ns() // 1_000_000_000
+    return now + offset
 
 
 def get_token_balance(wallet_provider: EvmWalletProvider, token_address: str) -> int:
@@ -167,20 +581,117 @@ def get_token_balance(wallet_provider: EvmWalletProvider, token_address: str) ->
         int: The balance in atomic units.
     """
     try:
-        # Hard-coded workaround for known WETH/USDC addresses on Ethereum mainnet
-        if token_address.lower() == "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2".lower():
-            # This is WETH on Ethereum mainnet
-            token_address = "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"  
-        elif token_address.lower() == "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48".lower():
-            # This is USDC on Ethereum mainnet
-            token_address = "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"  
-
-        # Work directly with lowercase addresses to bypass EIP-55 validation
+        # Checksum here so callers may pass lowercase addresses
         return wallet_provider.read_contract(
-            contract_address=token_address.lower(),
+            contract_address=_checksum(token_address),
             abi=ERC20_ABI,
             function_name="balanceOf",
-            args=[wallet_provider.get_address()],
+            args=[_owner(wallet_provider)],
         )
     except Exception as e:
         raise ValueError(f"Could not get token balance: {str(e)}") from e
+
+
+def aggregate_calls(wallet_provider: EvmWalletProvider, calls: list[tuple[str, bytes]]) -> list[bytes | None]:
+    """Execute several read-only calls in a single eth_call through Multicall3.aggregate3.
+
+    The aggregate3 call goes through wallet_provider.read_contract, so it works with any
+    EVM wallet provider. Multicall3 is deployed on every supported network.
+
+    Args:
+        wallet_provider: The wallet provider for reading from contracts.
+        calls: (target address, ABI-encoded call data) pairs.
+
+    Returns:
+        list: The raw return data of each call, or None where that call reverted.
+
+    """
+    results = wallet_provider.read_contract(
+        contract_address=MULTICALL3_ADDRESS,
+        abi=MULTICALL3_ABI,
+        function_name="aggregate3",
+        args=[[(target, True, call_data) for target, call_data in calls]],
+    )
+    return [return_data if success else None for success, return_data in results]
+
+
+def _decode_symbol(data: bytes) -> str:
+    """Decode a symbol() return value, accepting the legacy bytes32 form (e.g. MKR) as well as string."""
+    if len(data) == 32:
+        return data.rstrip(b"\x00").decode("utf-8", errors="replace")
+    return decode(["string"], data)[0]
+
+
+def fetch_token_context(
+    wallet_provider: EvmWalletProvider,
+    token_addresses: list[str],
+    spender: str | None = None,
+) -> dict[str, dict]:
+    """Read decimals, symbol, balance and (optionally) allowance for several tokens in one RPC.
+
+    All reads are packed into a single Multicall3 aggregate3 call. Decimals and symbols already
+    in the token metadata cache are not re-read; newly read ones are added to it.
+
+    Args:
+        wallet_provider: The wallet provider for reading from contracts.
+        token_addresses: The addresses of the tokens to read.
+        spender: (Optional) The address whose allowance from the wallet is also read.
+
+    Returns:
+        dict: Checksummed token address -> {"decimals", "symbol", "balance"[, "allowance"]},
+            with amounts in atomic units.
+
+    Raises:
+        ValueError: If any of the reads reverted.
+
+    """
+    token_addresses = [_checksum(token) for token in token_addresses]
+    chain_id = wallet_provider.get_network().chain_id
+    owner = _owner(wallet_provider)
+    balance_of = BALANCE_OF_SELECTOR + encode(["address"], [owner])
+    allowance = (
+        ALLOWANCE_SELECTOR + encode(["address", "address"], [owner, _checksum(spender)])
+        if spender
+        else None
+    )
+
+    calls = []
+    fields = []
+    for token in token_addresses:
+        if (chain_id, token) not in _TOKEN_DECIMALS:
+            calls.append((token, DECIMALS_SELECTOR))
+            fields.append((token, "decimals"))
+        if (chain_id, token) not in _TOKEN_SYMBOLS:
+            calls.append((token, SYMBOL_SELECTOR))
+            fields.append((token, "symbol"))
+        calls.append((token, balance_of))
+        fields.append((token, "balance"))
+        if allowance is not None:
+            calls.append((token, allowance))
+            fields.append((token, "allowance"))
+
+    results = aggregate_calls(wallet_provider, calls)
+    if any(result is None for result in results):
+        raise ValueError("Could not read token state")
+
+    context = {
+        token: {
+            "decimals": _TOKEN_DECIMALS.get((chain_id, token)),
+            "symbol": _TOKEN_SYMBOLS.get((chain_id, token)),
+        }
+        for token in token_addresses
+    }
+    metadata_fetched = False
+    for (token, name), result in zip(fields, results, strict=True):
+        if name == "symbol":
+            context[token]["symbol"] = _TOKEN_SYMBOLS[(chain_id, token)] = _decode_symbol(result)
+            metadata_fetched = True
+        elif name == "decimals":
+            context[token]["decimals"] = _TOKEN_DECIMALS[(chain_id, token)] = _decode_uint(result)
+            metadata_fetched = True
+        else:
+            context[token][name] = _decode_uint(result)
+
+    if metadata_fetched:
+        _save_token_metadata_cache()
+    return context